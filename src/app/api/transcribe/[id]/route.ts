@@ -6,13 +6,8 @@ import {
   getValidationService,
   getErrorHandlingService
 } from '@/lib/di/containerSetup';
+import { TranscriptionOrchestrator } from '@/lib/services/core/TranscriptionOrchestrator';
 import { debugLog } from '@/lib/utils/debug';
-import { exec } from 'child_process';
-import { promisify } from 'util';
-import { promises as fs } from 'fs';
-import { join } from 'path';
-
-const execAsync = promisify(exec);
 
 export async function POST(
   request: NextRequest,
@@ -74,10 +69,13 @@ export async function POST(
           started_at: new Date().toISOString(),
         });
 
-        // Start transcription in background (fire and forget)
-        transcribeInBackground(file, job.id).catch(error => {
-          debugLog('api', 'Background transcription failed:', error);
-        });
+        // Hand off to the long-lived Whisper container so models stay loaded
+        // between jobs instead of being cold-loaded by a one-shot process
+        await TranscriptionOrchestrator.startBackgroundTranscription(
+          fileId,
+          file.file_name
+        );
+        debugLog('api', 'Background transcription started', { jobId: job.id });
 
         return errorHandlingService.handleSuccess({
           message: 'Transcription started',
@@ -104,84 +102,3 @@ export async function POST(
     }
   )(request);
 }
-
-async function transcribeInBackground(file: any, jobId: number) {
-  const transcriptionRepo = getTranscriptionRepository();
-
-  try {
-    // Update job status to processing
-    await transcriptionRepo.updateProgress(jobId, 10, 'processing');
-
-    // Path to audio file
-    const audioPath = join(process.cwd(), 'data', 'audio_files', file.fileName);
-
-    // Check if file exists
-    await fs.access(audioPath);
-
-    // Convert to WAV if needed (Whisper works better with WAV)
-    const wavPath = audioPath.replace(/\.[^/.]+$/, '.wav');
-    if (!audioPath.endsWith('.wav')) {
-      debugLog('worker', 'Converting to WAV...', { audioPath, wavPath });
-      await execAsync(
-        `ffmpeg -i "${audioPath}" -ar 16000 -ac 1 -c:a pcm_s16le "${wavPath}" -y`
-      );
-    }
-
-    // Update progress
-    await transcriptionRepo.updateProgress(jobId, 30);
-
-    // Run Whisper transcription using Python script
-    const pythonScript = join(process.cwd(), 'scripts', 'transcribe.py');
-    debugLog('worker', 'Running transcription...', { pythonScript, wavPath });
-
-    const { stdout, stderr } = await execAsync(
-      `python3 "${pythonScript}" "${wavPath}" --model base --language en`,
-      { maxBuffer: 10 * 1024 * 1024 } // 10MB buffer
-    );
-
-    if (stderr) {
-      debugLog('worker', 'Transcription warnings:', stderr);
-    }
-
-    // Parse transcription result (assuming JSON output)
-    let transcript;
-    try {
-      transcript = JSON.parse(stdout);
-    } catch (e) {
-      // If not JSON, treat as plain text
-      transcript = { text: stdout.trim(), segments: [] };
-    }
-
-    // Update job with results using repository
-    const transcriptSegments = transcript.segments || [
-      {
-        text: transcript.text || stdout.trim(),
-        start: 0,
-        end: 0,
-      },
-    ];
-
-    await transcriptionRepo.updateWithResults(jobId, {
-      status: 'completed',
-      progress: 100,
-      transcript: transcriptSegments,
-      completedAt: new Date(),
-    });
-
-    debugLog('worker', 'Transcription completed for job:', jobId);
-
-    // Clean up WAV file if we created it
-    if (!audioPath.endsWith('.wav')) {
-      await fs.unlink(wavPath).catch(() => {});
-    }
-  } catch (error) {
-    debugLog('worker', 'Transcription error:', error);
-
-    // Update job status to failed using repository
-    await transcriptionRepo.updateWithError(jobId, {
-      status: 'failed',
-      lastError: error instanceof Error ? error.message : 'Unknown error',
-      completedAt: new Date(),
-    });
-  }
-}
@@ -120,20 +120,28 @@ export class AudioConverter {
     channels: number;
   }> {
     return await ErrorHandler.serviceMethod(async () => {
-      // Get duration
-      const durationCmd = `ffprobe -v quiet -show_entries format=duration -of csv=p=0 "${filePath}"`;
-      const { stdout: durationOutput } = await execAsync(durationCmd);
-      const duration = Math.round(parseFloat(durationOutput.trim()) || 0);
-
-      // Get sample rate and channels
-      const audioCmd = `ffprobe -v quiet -show_entries stream=sample_rate,channels -of csv=p=0 "${filePath}"`;
-      const { stdout: audioOutput } = await execAsync(audioCmd);
-      const [sampleRateStr, channelsStr] = audioOutput.trim().split(',');
-      
-      const sampleRate = parseInt(sampleRateStr, 10) || this.DEFAULT_SAMPLE_RATE;
-      const channels = parseInt(channelsStr, 10) || this.DEFAULT_CHANNELS;
+      // Read duration, sample rate and channels in a single ffprobe pass
+      const probeCmd = `ffprobe -v quiet -select_streams a:0 -show_entries format=duration:stream=sample_rate,channels -of json "${filePath}"`;
+      const { stdout } = await execAsync(probeCmd);
+      const probe = JSON.parse(stdout);
+      const stream = probe.streams?.[0] ?? {};
+
+      let duration = parseFloat(probe.format?.duration);
+
+      // WebM/Opus from MediaRecorder usually carries no container duration
+      // (ffprobe reports N/A), so measure it from the audio packets instead
+      if (!Number.isFinite(duration)) {
+        duration = await this.measureStreamDuration(filePath);
+      }
 
-      return { duration, sampleRate, channels };
+      const sampleRate = parseInt(stream.sample_rate, 10) || this.DEFAULT_SAMPLE_RATE;
+      const channels = parseInt(stream.channels, 10) || this.DEFAULT_CHANNELS;
+
+      return {
+        duration: Math.round(Number.isFinite(duration) ? duration : 0),
+        sampleRate,
+        channels,
+      };
     }, {
       service: 'AudioConverter',
       operation: 'extractAudioMetadata',
@@ -141,6 +149,55 @@ export class AudioConverter {
     });
   }
 
+  /**
+   * Measure duration by stream-copying the audio to the null muxer and
+   * reading the final progress timestamp (returns NaN if none is reported)
+   */
+  private static async measureStreamDuration(filePath: string): Promise<number> {
+    const measureCmd = `ffmpeg -nostdin -v error -i "${filePath}" -map 0:a:0 -c copy -f null -progress pipe:1 -`;
+    const { stdout } = await execAsync(measureCmd);
+
+    // Progress blocks repeat; the last out_time is the end of the stream
+    const outTimes = stdout.match(/^out_time=\d+:\d+:[\d.]+$/gm);
+    if (!outTimes) {
+      return NaN;
+    }
+
+    const [hours, minutes, seconds] = outTimes[outTimes.length - 1]
+      .slice('out_time='.length)
+      .split(':');
+
+    return parseInt(hours, 10) * 3600 + parseInt(minutes, 10) * 60 + parseFloat(seconds);
+  }
+
+  /**
+   * Extract metadata from an audio buffer without converting it
+   */
+  static async extractBufferMetadata(
+    inputBuffer: Buffer,
+    originalFileName: string
+  ): Promise<{
+    duration: number;
+    sampleRate: number;
+    channels: number;
+  }> {
+    return await ErrorHandler.serviceMethod(async () => {
+      const originalExt = originalFileName.split('.').pop()?.toLowerCase() || 'mp3';
+      const inputPath = join(this.DEFAULT_TEMP_DIR, `probe_${uuidv4()}.${originalExt}`);
+
+      try {
+        await fs.writeFile(inputPath, inputBuffer);
+        return await this.extractAudioMetadata(inputPath);
+      } finally {
+        await fs.unlink(inputPath).catch(() => {});
+      }
+    }, {
+      service: 'AudioConverter',
+      operation: 'extractBufferMetadata',
+      metadata: { originalFileName, bufferSize: inputBuffer.length }
+    });
+  }
+
   /**
    * Convert audio buffer directly without file I/O (for supported formats)
    */
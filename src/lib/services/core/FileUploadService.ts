@@ -66,7 +66,7 @@ export class FileUploadService {
       const { fileName, storagePath } = await this.saveFileToStorage(file, buffer);
 
       // Extract audio metadata
-      const duration = await this.extractAudioDuration(storagePath);
+      const duration = await this.extractAudioDuration(buffer, file.name);
 
       // Create database record
       const audioFile = await this.createDatabaseRecord(
@@ -186,22 +186,12 @@ export class FileUploadService {
     return { fileName, storagePath };
   }
 
-  private async extractAudioDuration(storagePath: string): Promise<number> {
+  private async extractAudioDuration(buffer: Buffer, fileName: string): Promise<number> {
     try {
-      const storageConfig = configManager.getStorageConfig();
-      const fileBuffer = await this.storageService.downloadFile(
-        storageConfig.buckets.audioFiles,
-        storagePath
-      );
-
-      // Use AudioConverter to extract metadata
-      const tempFileName = `temp_${uuidv4()}.${storagePath.split('.').pop()}`;
-      const conversionResult = await AudioConverter.convertToWav(fileBuffer, tempFileName);
-      
-      // Cleanup temporary file
-      await AudioConverter.cleanupTempFiles([conversionResult.outputPath]);
-      
-      return conversionResult.duration;
+      // Probe the bytes we already hold: ffprobe reads every accepted format,
+      // so there is no need to re-download the upload or convert it to WAV
+      const metadata = await AudioConverter.extractBufferMetadata(buffer, fileName);
+      return metadata.duration;
     } catch (error) {
       console.warn('Failed to extract duration:', error);
       return 0;
@@ -37,12 +37,16 @@ export interface TranscriptionResult {
   segments: TranscriptSegment[];
 }
 
+// whisper.cpp emits bracketed annotations such as [BLANK_AUDIO] for silence
+const NON_SPEECH_PATTERN = /^\[[^\]]*\]$/;
+
 // Helper function to parse Whisper diarized text into segments
 function parseWhisperTextToSegments(whisperText: string): TranscriptSegment[] {
   const segments: TranscriptSegment[] = [];
   const lines = whisperText.split('\n').filter(line => line.trim());
 
   let currentTime = 0;
+  let skippedNonSpeech = false;
   const SEGMENT_DURATION = 5; // Default 5 seconds per segment
 
   for (const line of lines) {
@@ -51,10 +55,18 @@ function parseWhisperTextToSegments(whisperText: string): TranscriptSegment[] {
 
     // Check if line contains speaker information
     const speakerMatch = trimmedLine.match(/^\(speaker (\?|\d+)\)\s*(.+)$/);
+    const text = speakerMatch ? speakerMatch[2].trim() : trimmedLine;
+
+    // Silence markers carry no speech: keep the timeline moving, but don't
+    // emit a segment or attribute the silence to a speaker
+    if (NON_SPEECH_PATTERN.test(text)) {
+      currentTime += SEGMENT_DURATION;
+      skippedNonSpeech = true;
+      continue;
+    }
 
     if (speakerMatch) {
       const speakerId = speakerMatch[1];
-      const text = speakerMatch[2].trim();
 
       if (text) {
         segments.push({
@@ -80,7 +92,7 @@ function parseWhisperTextToSegments(whisperText: string): TranscriptSegment[] {
   }
 
   // If no segments were created, create one from the entire text
-  if (segments.length === 0 && whisperText.trim()) {
+  if (segments.length === 0 && !skippedNonSpeech && whisperText.trim()) {
     segments.push({
       start: 0,
       end: 30, // Default duration
@@ -92,27 +104,29 @@ function parseWhisperTextToSegments(whisperText: string): TranscriptSegment[] {
   return segments;
 }
 
+// Helper function to check the Whisper Docker container is up
+async function checkWhisperHealth(): Promise<void> {
+  const healthResponse = await axios.get(`${WHISPER_API_URL}/health`, {
+    timeout: 5000,
+  });
+
+  if (healthResponse.data.status !== 'ok') {
+    throw new Error('Whisper container not healthy');
+  }
+}
+
 // Helper function to call Whisper Docker container API
 async function tryTranscription(
   audioPath: string,
   outputPath: string,
   device: 'cuda' | 'cpu',
   speakerCount?: number
-): Promise<boolean> {
+): Promise<TranscriptionResult | null> {
   const inferenceUrl = `${WHISPER_API_URL}/inference`;
 
-  console.log(`🎙️ Starting Whisper transcription for ${audioPath}`);
+  debugLog(`🎙️ Starting Whisper transcription for ${audioPath}`);
 
   try {
-    // First check if Whisper container is available
-    const healthResponse = await axios.get(`${WHISPER_API_URL}/health`, {
-      timeout: 5000,
-    });
-
-    if (healthResponse.data.status !== 'ok') {
-      throw new Error('Whisper container not healthy');
-    }
-
     // Prepare FormData for API call
     const formData = new FormData();
     formData.append('file', createReadStream(audioPath));
@@ -124,7 +138,7 @@ async function tryTranscription(
     const fileStats = await stat(audioPath);
     const fileSizeMB = (fileStats.size / 1024 / 1024).toFixed(2);
     
-    console.log(`📡 Sending audio file to Whisper container: ${audioPath} (${fileSizeMB}MB)`);
+    debugLog(`📡 Sending audio file to Whisper container: ${audioPath} (${fileSizeMB}MB)`);
 
     // Call Whisper API
     const response = await axios.post(inferenceUrl, formData, {
@@ -133,7 +147,7 @@ async function tryTranscription(
     });
 
     const whisperResult = response.data;
-    console.log(
+    debugLog(
       `✅ Whisper transcription completed: ${whisperResult.text?.length || 0} characters`
     );
 
@@ -141,12 +155,12 @@ async function tryTranscription(
     const transcriptText = whisperResult.text || '';
     const segments = parseWhisperTextToSegments(transcriptText);
 
-    const result = {
+    const result: TranscriptionResult = {
       segments: segments,
     };
 
-    // Write result to output file
-    await writeFile(outputPath, JSON.stringify(result, null, 2));
+    // Write result to output file (compact: transcripts can run to many MB)
+    await writeFile(outputPath, JSON.stringify(result));
 
     // Create metadata file
     const metadataPath = outputPath.replace('.json', '_metadata.json');
@@ -161,11 +175,11 @@ async function tryTranscription(
     };
     await writeFile(metadataPath, JSON.stringify(metadata, null, 2));
 
-    console.log(`✅ Transcription completed successfully for ${audioPath}`);
-    return true;
+    debugLog(`✅ Transcription completed successfully for ${audioPath}`);
+    return result;
   } catch (error) {
     console.error(`❌ Whisper transcription failed for ${audioPath}:`, error);
-    return false;
+    return null;
   }
 }
 
@@ -230,6 +244,28 @@ export async function startTranscription(
       throw new Error(`Failed to update job status: ${updateError1.message}`);
     }
 
+    // Fail fast if Whisper is down, before downloading the audio file
+    try {
+      await checkWhisperHealth();
+    } catch (error) {
+      const errorMessage = `Whisper container unavailable: ${error instanceof Error ? error.message : 'Unknown error'}`;
+      debugLog(`❌ ${errorMessage}`);
+
+      await supabase
+        .from('transcription_jobs')
+        .update({
+          status: 'failed',
+          last_error: errorMessage,
+          diarization_status: 'failed',
+          diarization_error:
+            'Whisper container unavailable before diarization could be attempted',
+          completed_at: new Date().toISOString(),
+          updated_at: new Date().toISOString(),
+        })
+        .eq('id', job.id);
+      throw new Error(errorMessage);
+    }
+
     // Download audio file from Supabase storage to temporary file
     const storageService = new SupabaseStorageService();
     let tempAudioPath: string;
@@ -300,21 +336,21 @@ export async function startTranscription(
       .eq('id', job.id);
 
     // Try GPU first, then fallback to CPU
-    let success = false;
+    let result: TranscriptionResult | null = null;
 
     // Wrap transcription in try-finally to ensure cleanup
     try {
       debugLog(`🚀 Starting Whisper transcription...`);
       debugLog(`Temporary audio file: ${tempAudioPath}`);
       
-      success = await tryTranscription(
+      result = await tryTranscription(
         tempAudioPath,
         outputPath,
         'cuda',
         finalSpeakerCount
       );
 
-      if (!success) {
+      if (!result) {
         debugLog('🔄 GPU transcription failed, falling back to CPU...');
         // Update progress
         await supabase
@@ -325,7 +361,7 @@ export async function startTranscription(
           })
           .eq('id', job.id);
 
-        success = await tryTranscription(
+        result = await tryTranscription(
           tempAudioPath,
           outputPath,
           'cpu',
@@ -346,7 +382,7 @@ export async function startTranscription(
       }
     }
 
-    if (success) {
+    if (result) {
       // Update progress
       await supabase
         .from('transcription_jobs')
@@ -356,33 +392,6 @@ export async function startTranscription(
         })
         .eq('id', job.id);
 
-      // Verify the output file exists and is valid
-      let result: TranscriptionResult;
-      try {
-        const transcriptData = await readFile(outputPath, 'utf-8');
-        result = JSON.parse(transcriptData);
-
-        if (!result.segments || !Array.isArray(result.segments)) {
-          throw new Error('Invalid transcript format: missing segments array');
-        }
-      } catch (parseError) {
-        const errorMsg = `Failed to read transcript file: ${
-          parseError instanceof Error ? parseError.message : 'Unknown error'
-        }`;
-
-        await supabase
-          .from('transcription_jobs')
-          .update({
-            status: 'failed',
-            last_error: errorMsg,
-            completed_at: new Date().toISOString(),
-            updated_at: new Date().toISOString(),
-          })
-          .eq('id', job.id);
-
-        throw new Error(errorMsg);
-      }
-
       debugLog(
         `✅ Transcription completed with ${result.segments.length} segments`
       );